@@ -1,6 +1,9 @@
 # streamlit_app.py - Streamlit HR Chatbot
+import uuid
+
 import streamlit as st
 from hr_app.agent import chat_with_hr
+from hr_app.memory import reset_session_memory
 
 def main():
     st.set_page_config(page_title="HR Chatbot", page_icon="🤖", layout="wide")
@@ -36,11 +39,21 @@ def main():
     if "hr_chat_history" not in st.session_state:
         st.session_state.hr_chat_history = []
     
+    # Identify this browser session so the agent can keep bounded memory
+    if "hr_session_id" not in st.session_state:
+        st.session_state.hr_session_id = str(uuid.uuid4())
+    
     # Display chat messages from history
     for message in st.session_state.hr_chat_history:
         with st.chat_message(message["role"]):
             st.markdown(message["content"])
     
+    # Clear chat button (outside the input block so its click is handled on rerun)
+    if st.button("Clear Chat"):
+        st.session_state.hr_chat_history = []
+        reset_session_memory(st.session_state.hr_session_id)
+        st.rerun()
+    
     # Chat input
     if prompt := st.chat_input("What HR action would you like to perform?"):
         # Add user message to chat history
@@ -55,16 +68,11 @@ def main():
             message_placeholder = st.empty()
             with st.spinner("Processing your request..."):
                 # Get response from the HR agent
-                response = chat_with_hr(prompt)
+                response = chat_with_hr(prompt, st.session_state.hr_session_id)
                 message_placeholder.markdown(response)
         
         # Add assistant response to chat history
         st.session_state.hr_chat_history.append({"role": "assistant", "content": response})
-        
-        # Add clear chat button
-        if st.button("Clear Chat"):
-            st.session_state.hr_chat_history = []
-            st.rerun()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -7,6 +7,7 @@ from langchain.chat_models import init_chat_model
 from langchain.tools import tool
 
 from .db import HRManagementSystem
+from .memory import get_session_memory
 from .model import Employee
 from .utils import sanitize_salary_input
 
@@ -259,8 +260,12 @@ except Exception as e:
 
 # --- Main chat function ---
 
-def chat_with_hr(user_input: str) -> str:
-    """Main function to interact with the HR agent."""
+def chat_with_hr(user_input: str, session_id: Optional[str] = None) -> str:
+    """Main function to interact with the HR agent.
+    
+    When a session_id is given, a bounded summary of the earlier conversation
+    is sent along with the message so follow-up requests keep their context.
+    """
     
     if not agent_initialized:
         return (
@@ -271,15 +276,30 @@ def chat_with_hr(user_input: str) -> str:
         )
     
     try:
-        # Invoke the agent with the user input
-        response = agent.invoke({"messages": [{"role": "user", "content": user_input}]})
+        memory = get_session_memory(session_id) if session_id else None
+        history = memory.messages() if memory else []
+        
+        # Invoke the agent with the compacted history plus the user input
+        messages = history + [{"role": "user", "content": user_input}]
+        response = agent.invoke({"messages": messages})
         
         # Extract the final message
         if "messages" in response:
             last_message = response["messages"][-1]
             if hasattr(last_message, 'content'):
-                return last_message.content
-            return str(last_message)
+                reply = last_message.content
+            else:
+                reply = str(last_message)
+            
+            if memory:
+                # Only the tool names are kept; their raw output is dropped
+                new_messages = response["messages"][len(messages):]
+                tools_used = [
+                    m.name for m in new_messages
+                    if getattr(m, 'type', None) == 'tool' and getattr(m, 'name', None)
+                ]
+                memory.add_turn(user_input, str(reply), tools_used)
+            return reply
         
         return str(response)
         
@@ -4,4 +4,10 @@ import os
 
 load_dotenv()  # load .env from project root
 # DB_FILE environment variable with fallback to employees.db
-DB_FILE = os.getenv("DB_FILE", "employees.db")
\ No newline at end of file
+DB_FILE = os.getenv("DB_FILE", "employees.db")
+# Conversation memory limits (approximate tokens, ~4 characters per token)
+HISTORY_TOKEN_BUDGET = int(os.getenv("HISTORY_TOKEN_BUDGET", "1500"))
+# Number of most recent turns kept as full turns (capped to fit the budget)
+HISTORY_RECENT_TURNS = int(os.getenv("HISTORY_RECENT_TURNS", "3"))
+# Maximum number of chat sessions whose memory is kept (least recently used are evicted)
+HISTORY_MAX_SESSIONS = int(os.getenv("HISTORY_MAX_SESSIONS", "100"))
@@ -0,0 +1,162 @@
+# hr_app/memory.py - bounded per-session conversation memory for the agent
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from .config import HISTORY_TOKEN_BUDGET, HISTORY_RECENT_TURNS, HISTORY_MAX_SESSIONS
+
+# Rough characters-per-token ratio used for budgeting (no tokenizer needed)
+CHARS_PER_TOKEN = 4
+# Share of the token budget reserved for the summary of folded turns
+SUMMARY_BUDGET_SHARE = 0.25
+# Tools whose replies are bulky listings/reports; only an excerpt is stored
+BULKY_TOOLS = {"view_all_employees", "salary_report"}
+# Length of stored excerpts (bulky replies and replies of older turns)
+EXCERPT_MAX_CHARS = 300
+# Each turn folded into the summary is reduced to a single short line
+SUMMARY_LINE_MAX_CHARS = 160
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate the token count of a string."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to at most `limit` characters, marking the cut."""
+    if len(text) <= limit:
+        return text
+    return text[: max(limit - 3, 0)].rstrip() + "..."
+
+
+def _shorten(text: str, limit: int) -> str:
+    """Collapse whitespace and cut text to at most `limit` characters."""
+    return _truncate(" ".join(text.split()), limit)
+
+
+class ConversationMemory:
+    """Token-budgeted conversation history for a single chat session.
+
+    A fixed share of the budget is reserved for a running summary of folded
+    turns; the rest holds the most recent turns, each message capped so that
+    `recent_turns` full turns always fit. Replies from listing/report tools
+    are stored as short excerpts, and older turns are shrunk further before
+    being folded into the summary.
+    """
+
+    def __init__(
+        self,
+        token_budget: int = HISTORY_TOKEN_BUDGET,
+        recent_turns: int = HISTORY_RECENT_TURNS,
+    ):
+        self.token_budget = token_budget
+        self.recent_turns = max(1, recent_turns)
+        self.summary_budget = int(token_budget * SUMMARY_BUDGET_SHARE)
+        self.turns_budget = token_budget - self.summary_budget
+        # Per-message cap so that `recent_turns` user/assistant pairs fit
+        per_message_tokens = self.turns_budget // (2 * self.recent_turns)
+        self.message_max_chars = max((per_message_tokens - 1) * CHARS_PER_TOKEN, 0)
+        self.turns: List[Dict] = []  # {"user", "assistant", "tools"}
+        self.summary_lines: List[str] = []
+
+    def add_turn(self, user: str, assistant: str, tools: Optional[List[str]] = None):
+        """Record a completed user/assistant exchange and compact history."""
+        tools = list(tools or [])
+        if BULKY_TOOLS.intersection(tools):
+            assistant = _shorten(assistant, EXCERPT_MAX_CHARS)
+        self.turns.append({
+            "user": _truncate(user, self.message_max_chars),
+            "assistant": _truncate(assistant, self.message_max_chars),
+            "tools": tools,
+        })
+        self._compact()
+
+    def clear(self):
+        """Forget the whole conversation."""
+        self.turns = []
+        self.summary_lines = []
+
+    def _render_turn(self, turn: Dict, recent: bool) -> List[Dict[str, str]]:
+        """Convert a stored turn to chat messages, shrinking it if old."""
+        assistant = turn["assistant"]
+        if not recent:
+            assistant = _shorten(assistant, EXCERPT_MAX_CHARS)
+            if turn["tools"]:
+                assistant += f"\n(tools used: {', '.join(turn['tools'])})"
+        return [
+            {"role": "user", "content": turn["user"]},
+            {"role": "assistant", "content": assistant},
+        ]
+
+    def _summary_message(self) -> Optional[Dict[str, str]]:
+        if not self.summary_lines:
+            return None
+        return {
+            "role": "system",
+            "content": "Summary of earlier conversation:\n" + "\n".join(self.summary_lines),
+        }
+
+    def _summarize_turn(self, turn: Dict) -> str:
+        line = f"- User: {_shorten(turn['user'], SUMMARY_LINE_MAX_CHARS // 2)}"
+        if turn["tools"]:
+            line += f" [tools: {', '.join(turn['tools'])}]"
+        line += f" -> {_shorten(turn['assistant'], SUMMARY_LINE_MAX_CHARS // 2)}"
+        return line
+
+    def _turn_messages(self) -> List[Dict[str, str]]:
+        first_recent = len(self.turns) - self.recent_turns
+        msgs = []
+        for i, turn in enumerate(self.turns):
+            msgs.extend(self._render_turn(turn, recent=i >= first_recent))
+        return msgs
+
+    def _summary_tokens(self) -> int:
+        summary = self._summary_message()
+        return estimate_tokens(summary["content"]) if summary else 0
+
+    def _turns_tokens(self) -> int:
+        return sum(estimate_tokens(m["content"]) for m in self._turn_messages())
+
+    def _compact(self):
+        """Fold oldest turns into the summary until each part fits its share."""
+        while self.turns and self._turns_tokens() > self.turns_budget:
+            self.summary_lines.append(self._summarize_turn(self.turns.pop(0)))
+
+        # The summary has its own share; drop its oldest lines first
+        while self.summary_lines and self._summary_tokens() > self.summary_budget:
+            self.summary_lines.pop(0)
+
+    def tokens(self) -> int:
+        """Estimated token count of the history returned by messages()."""
+        return self._summary_tokens() + self._turns_tokens()
+
+    def messages(self) -> List[Dict[str, str]]:
+        """Return the compacted history as chat messages for the agent."""
+        summary = self._summary_message()
+        return ([summary] if summary else []) + self._turn_messages()
+
+
+# Conversation memory per chat session, least recently used first
+_sessions: "OrderedDict[str, ConversationMemory]" = OrderedDict()
+_sessions_lock = threading.Lock()
+
+
+def get_session_memory(session_id: str) -> ConversationMemory:
+    """Return the memory for a session, creating it on first use."""
+    with _sessions_lock:
+        memory = _sessions.get(session_id)
+        if memory is None:
+            memory = ConversationMemory()
+            _sessions[session_id] = memory
+            # Evict the least recently used sessions beyond the limit
+            while len(_sessions) > HISTORY_MAX_SESSIONS:
+                _sessions.popitem(last=False)
+        else:
+            _sessions.move_to_end(session_id)
+        return memory
+
+
+def reset_session_memory(session_id: str):
+    """Drop all stored history for a session."""
+    with _sessions_lock:
+        _sessions.pop(session_id, None)
@@ -0,0 +1,64 @@
+# tests/test_memory.py - tests for bounded conversation memory
+from hr_app import memory
+from hr_app.memory import ConversationMemory, get_session_memory, reset_session_memory
+
+LISTING = "### Current Employees:\n" + "\n".join(
+    f"- **E{i:03d}**: Name {i}, Engineering, Developer, Salary: $75,000.00"
+    for i in range(100)
+)
+
+
+def test_budget_enforced_for_recent_turns():
+    mem = ConversationMemory(token_budget=1500, recent_turns=3)
+    for _ in range(3):
+        mem.add_turn("u" * 2000, "a" * 2000)
+    assert mem.tokens() <= mem.token_budget
+
+
+def test_budget_stays_bounded_over_long_session():
+    mem = ConversationMemory(token_budget=800, recent_turns=3)
+    for i in range(50):
+        mem.add_turn(f"show all employees {i}", LISTING, ["view_all_employees"])
+        mem.add_turn(f"raise his salary {i}", "x" * 3000, ["update_employee"])
+        assert mem.tokens() <= mem.token_budget
+
+
+def test_summary_survives_bulky_recent_turns():
+    mem = ConversationMemory(token_budget=1500, recent_turns=3)
+    mem.add_turn("Find employee JD001 Alice", "Found JD001: Alice, Engineering", ["search_employee"])
+    for _ in range(12):
+        mem.add_turn("search for employees named E", LISTING, ["search_employee"])
+    assert mem.turns[0]["user"] != "Find employee JD001 Alice"
+    summary = mem.messages()[0]
+    assert summary["role"] == "system"
+    assert "JD001" in summary["content"]
+
+
+def test_listing_replies_stored_as_excerpt():
+    mem = ConversationMemory()
+    mem.add_turn("show all employees", LISTING, ["view_all_employees"])
+    stored = mem.turns[-1]["assistant"]
+    assert len(stored) <= memory.EXCERPT_MAX_CHARS
+    assert stored.endswith("...")
+
+
+def test_old_turns_are_shortened():
+    mem = ConversationMemory(token_budget=4000, recent_turns=1)
+    reply = "Found 3 employee(s):\n" + "- **E1**: Someone (Engineering, Developer)\n" * 20
+    mem.add_turn("search for employees named Someone", reply, ["search_employee"])
+    mem.add_turn("thanks", "You're welcome!")
+    old_reply = mem.messages()[1]["content"]
+    assert "(tools used: search_employee)" in old_reply
+    assert len(old_reply) < len(reply)
+
+
+def test_sessions_are_lru_bounded(monkeypatch):
+    monkeypatch.setattr(memory, "HISTORY_MAX_SESSIONS", 2)
+    monkeypatch.setattr(memory, "_sessions", memory.OrderedDict())
+    first = get_session_memory("a")
+    get_session_memory("b")
+    assert get_session_memory("a") is first  # marks "a" as recently used
+    get_session_memory("c")
+    assert list(memory._sessions) == ["a", "c"]
+    reset_session_memory("a")
+    assert list(memory._sessions) == ["c"]